@@ -6,29 +6,480 @@ Developed on Fri Aug 29 20:19:22 2025
 
 @author: Dr. Hakan İbrahim Tol
 
-f_clamond(R, K=0.0, iters=2)
+f_clamond(R, K=0.0, iters=2, dtype=np.float64)
 - R: Reynolds number (scalar or array), recommended R >= 2300 (turbulent).
 - K: relative roughness epsilon/D (scalar or array, broadcastable with R), K >= 0.
 - iters: number of quartic iterations; 2 achieves ~machine precision in double.
+- dtype: working precision, np.float64 (default) or np.float32 (see f_clamond_f32).
 
 Returns:
 - Darcy–Weisbach friction factor f (same shape as broadcasted R, K).
 
+Array inputs run through a fused Numba kernel when numba is installed,
+otherwise through plain NumPy ufuncs (same results). The selected backend
+('numba' or 'numpy') is recorded in _CLAMOND_BACKEND.
+
 Reference:
 Clamond, D. "Efficient resolution of the Colebrook equation", arXiv:0810.5564 (2008).
 
 """
 
+import functools
+import math
 import numpy as np
+import operator
 import warnings
 
+# Optional: Numba fuses the whole iteration into one compiled kernel for arrays
+try:
+    from numba import njit, prange, types
+    from numba.extending import overload
+    _HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - plain NumPy fallback
+    _HAVE_NUMBA = False
+
+# Array backend, chosen once at import. Numba JIT-compiles the fused kernel for
+# the host CPU (its widest SIMD, AVX2/AVX-512 where present); without numba,
+# 'numpy' uses NumPy's own runtime-dispatched SIMD ufuncs.
+_CLAMOND_BACKEND = "numba" if _HAVE_NUMBA else "numpy"
+
 # Constants used by Clamond’s scheme
-_LOG10 = np.log(10.0)                       # ln(10)
-_C1 = _LOG10 / 18.574                       # 0.123968186335417556
-_C2 = np.log(1.0 / 5.02) + np.log(_LOG10)   # ln(ln(10)/5.02) = -0.779397488455682028
+# (plain Python floats, so float32 inputs are not promoted to float64)
+_LOG10 = math.log(10.0)                         # ln(10)
+_C1 = _LOG10 / 18.574                           # 0.123968186335417556
+_C2 = math.log(1.0 / 5.02) + math.log(_LOG10)   # ln(ln(10)/5.02) = -0.779397488455682028
 _A  = 1.151292546497022842                  # 0.5*ln(10) used in final mapping
+_A2 = _A * _A                               # f = _A2 / F^2: one multiply + one divide
+
+# Odd-power coefficients 2/(2k+1) of 2*atanh(s) = log((1 + s)/(1 - s)), k = 0..7
+_ATANH2 = (2.0, 2.0 / 3.0, 2.0 / 5.0, 2.0 / 7.0, 2.0 / 9.0, 2.0 / 11.0, 2.0 / 13.0, 2.0 / 15.0)
+_ATANH2_F32 = tuple(np.float32(c) for c in _ATANH2)
+
+# The carried log update is used for |u| < _U_MAX only, where its truncation
+# error stays below 1e-16 (8e-17; 5e-16 already at u = -0.25). R >= 2300 keeps
+# |u| <= 0.217. Larger first steps occur at low R; there L is refreshed with the
+# exact log instead, so more iterations still converge.
+_U_MAX = 0.22
+
+# Log-domain checks: 'once' (before the first iteration), 'strict' (before every
+# iteration) or 'none'
+_VALIDATE_MODES = {"none": 0, "once": 1, "strict": 2}
+
+_LOG_DOMAIN_MSG = (
+    "Log domain error: X1 + F <= 0 in iteration. "
+    "Check R, K values (R>3 is recommended in the paper) or reduce iters."
+)
+
+def _check_log_domain(S):
+    """
+    Raise FloatingPointError if log(S) = log(X1 + F) is undefined anywhere.
+    """
+    if np.any(S <= 0.0):
+        raise FloatingPointError(_LOG_DOMAIN_MSG)
+
+def _log1p_series(u, c=_ATANH2):
+    """
+    log(1 + u) for small |u| (< _U_MAX) with multiply/add and one division only.
+    c holds the series coefficients (c[0] == 2), typed like u inside the kernel.
+    """
+    s = u / (c[0] + u)
+    s2 = s * s
+    # Horner in s^2, written out so compiled loops stay branch-free
+    return s * (c[0] + s2 * (c[1] + s2 * (c[2] + s2 * (c[3] + s2 * (c[4] + s2 * (c[5]
+                + s2 * (c[6] + s2 * c[7])))))))
+
+# Range-reduced log for the Numba kernel: x = m * 2^e with m in [sqrt(1/2), sqrt(2)),
+# log(x) = e*ln2 + 2*atanh(s), s = (m - 1)/(m + 1), |s| <= 0.1716. The series
+# truncated after s^21 is below 1e-16 there, and ln2 is split (hi + lo, fdlibm)
+# so e*ln2 stays exact: ~1 ulp overall, with FMAs and one divide only.
+_LN2_HI = 6.93147180369123816490e-01
+_LN2_LO = 1.90821492927058770002e-10
+_SQRT2 = 1.4142135623730951
+_DBL_MIN = 2.2250738585072014e-308      # smallest normal double
+_TWO54 = 18014398509481984.0            # 2^54: scales subnormals to normal
+# float32 twin (_log_reduced_f32): float ln2 split (fdlibm e_logf) and the
+# series truncated after s^9, whose error (s^10/11 < 2e-9) is below float eps
+_LN2_HI_F32 = 6.9313812256e-01
+_LN2_LO_F32 = 9.0580006145e-06
+_FLT_MIN = 1.17549435e-38               # smallest normal float
+_TWO25 = 33554432.0                     # 2^25
+
+# Elements per kernel block: 7 arrays x 512 doubles = 28 kB stays in L1
+_BLOCK = 512
+
+if _HAVE_NUMBA:
+    _log1p_series = njit(inline="always", cache=True)(_log1p_series)
+
+    @njit(fastmath={"contract"}, error_model="numpy", cache=True)
+    def _log_reduced_f64(x):
+        """
+        In-place natural log of a float64 array, by exponent / mantissa split on
+        the IEEE bits, so no libm call blocks vectorisation. x <= 0 and NaN give
+        NaN, +inf gives inf; subnormals are scaled by 2^54 first.
+        """
+        xb = x.view(np.uint64)
+        for i in range(x.size):
+            xi = x[i]
+            tiny = xi < _DBL_MIN
+            x[i] = xi * _TWO54 if tiny else xi
+            b = xb[i]
+            eb = np.int64(b >> np.uint64(52))
+            e = np.float64(eb - 1023) - (54.0 if tiny else 0.0)
+            m_bits = (b & np.uint64(0x000FFFFFFFFFFFFF)) | np.uint64(0x3FF0000000000000)
+            xb[i] = m_bits                    # x[i] is now the mantissa m in [1, 2)
+            m = x[i]
+            big = m > _SQRT2
+            m = m * 0.5 if big else m
+            e = e + 1.0 if big else e
+            s = (m - 1.0) / (m + 1.0)
+            s2 = s * s
+            p = 2.0 + s2 * (2.0 / 3.0 + s2 * (2.0 / 5.0 + s2 * (2.0 / 7.0 + s2 * (2.0 / 9.0
+                + s2 * (2.0 / 11.0 + s2 * (2.0 / 13.0 + s2 * (2.0 / 15.0 + s2 * (2.0 / 17.0
+                + s2 * (2.0 / 19.0 + s2 * (2.0 / 21.0))))))))))
+            r = e * _LN2_HI + (e * _LN2_LO + s * p)
+            r = xi if eb == 0x7FF else r      # inf (and NaN) pass through
+            x[i] = r if xi > 0.0 else np.nan
+
+    @njit(fastmath={"contract"}, error_model="numpy", cache=True)
+    def _log_reduced_f32(x):
+        """
+        _log_reduced_f64 for a float32 array: same split on the 32-bit pattern
+        (8-bit exponent, 23-bit mantissa), all in float32 so it runs at twice
+        the SIMD width of the float64 version.
+        """
+        ft = np.float32
+        one, half, sqrt2 = ft(1.0), ft(0.5), ft(_SQRT2)
+        c0, c1, c2, c3, c4 = ft(2.0), ft(2.0 / 3.0), ft(2.0 / 5.0), ft(2.0 / 7.0), ft(2.0 / 9.0)
+        ln2_hi, ln2_lo = ft(_LN2_HI_F32), ft(_LN2_LO_F32)
+        flt_min, two25, zero, nan = ft(_FLT_MIN), ft(_TWO25), ft(0.0), ft(np.nan)
+        xb = x.view(np.uint32)
+        for i in range(x.size):
+            xi = x[i]
+            tiny = xi < flt_min
+            x[i] = xi * two25 if tiny else xi
+            b = xb[i]
+            eb = np.int32(b >> np.uint32(23))
+            e = ft(eb - 127) - (ft(25.0) if tiny else zero)
+            xb[i] = (b & np.uint32(0x007FFFFF)) | np.uint32(0x3F800000)
+            m = x[i]
+            big = m > sqrt2
+            m = m * half if big else m
+            e = e + one if big else e
+            s = (m - one) / (m + one)
+            s2 = s * s
+            p = c0 + s2 * (c1 + s2 * (c2 + s2 * (c3 + s2 * c4)))
+            r = e * ln2_hi + (e * ln2_lo + s * p)
+            r = xi if eb == 0xFF else r
+            x[i] = r if xi > zero else nan
+
+    def _log_reduced(x):
+        """
+        In-place log of a float32 or float64 array: _log_reduced_f32 or
+        _log_reduced_f64 by dtype (chosen at compile time inside the kernels).
+        """
+        (_log_reduced_f32 if x.dtype == np.float32 else _log_reduced_f64)(x)
+
+    @overload(_log_reduced, jit_options={"cache": True})
+    def _log_reduced_typed(x):
+        if x.dtype == types.float32:
+            return lambda x: _log_reduced_f32(x)
+        return lambda x: _log_reduced_f64(x)
+
+    # No nnan/ninf: the log-domain tests must see NaN (a NaN input is not a
+    # domain error) and _log_reduced relies on x > 0 being false for NaN
+    _FASTMATH = {"contract", "arcp", "reassoc"}
+
+    @njit(fastmath=_FASTMATH, error_model="numpy", cache=True)
+    def _clamond_prep(R, K, X1, X2, L, w, iters):
+        """
+        Fill one block's X1 = K*R*_C1, X2 = ln(R) + _C2 and L = ln(X1 + F0)
+        (F0 = X2 - 0.2) in R.dtype, with both logs from _log_reduced on the
+        scratch w, of R.dtype too. K has the block's size, or size 1 for a
+        scalar K.
+        """
+        ft = R.dtype.type
+        C1, C2, seed = ft(_C1), ft(_C2), ft(0.2)
+        for i in range(R.size):
+            w[i] = R[i]
+        _log_reduced(w)
+        for i in range(R.size):
+            X2[i] = w[i] + C2
+        if K.size == R.size:
+            for i in range(R.size):
+                X1[i] = K[i] * R[i] * C1
+        else:
+            k = K[0]
+            for i in range(R.size):
+                X1[i] = k * R[i] * C1
+        if iters > 0:
+            for i in range(R.size):
+                w[i] = X1[i] + X2[i] - seed
+            _log_reduced(w)
+            for i in range(R.size):
+                L[i] = w[i]
+
+    @njit(fastmath=_FASTMATH, error_model="numpy", cache=True)
+    def _clamond_block(X1, X2, L, w, out, iters, check, c):
+        """
+        Clamond iteration on one block of flat, equally sized arrays.
+        X1 = K*R*_C1, X2 = ln(R) + _C2 and L = ln(X1 + F0) come in precomputed
+        (see _clamond_prep); F lives in out until the final mapping, and the
+        scratch w serves exact log refreshes of L. Each pass
+        over the block is a straight-line loop that LLVM vectorises
+        (AVX2/AVX-512 FMA and divides on the host CPU).
+        All constants are cast to X1.dtype so float32 input stays float32;
+        c is the matching _log1p_series coefficient tuple; check is the
+        _VALIDATE_MODES code.
+        Returns the number of log domain errors found.
+        """
+        ft = X1.dtype.type
+        A2 = ft(_A2)
+        zero, one, half, third, seed = ft(0.0), ft(1.0), ft(0.5), ft(1.0 / 3.0), ft(0.2)
+        umax = ft(_U_MAX)
+        bad = 0
+        if iters == 2:
+            # Hand-unrolled hot path (the paper's default): both steps per
+            # element in one pass, in registers. The second step reuses
+            # S1 = S0 - dF0 rather than recomputing X1 + F1, and the log
+            # update after the last step is not needed at all.
+            far = 0
+            for i in range(X1.size):
+                x2 = X2[i]
+                F = x2 - seed
+                S = X1[i] + F
+                if check > 0 and S <= zero:
+                    bad += 1
+                T = one + S
+                E = (L[i] + F - x2) / T
+                dF = (T + half * E) * E * S / (T + E * (one + E * third))
+                u = -dF / S
+                if abs(u) >= umax:
+                    far += 1
+                l = L[i] + _log1p_series(u, c)
+                F -= dF
+                S -= dF
+                if check == 2 and S <= zero:
+                    bad += 1
+                T = one + S
+                E = (l + F - x2) / T
+                dF = (T + half * E) * E * S / (T + E * (one + E * third))
+                F -= dF
+                out[i] = A2 / (F * F)
+            if far == 0:
+                return bad
+            # Some |u| out of the series' range (low R): redo the block on the
+            # general path below, which refreshes L exactly
+            bad = 0
+
+        for i in range(X1.size):
+            out[i] = X2[i] - seed
+        if iters == 0:
+            for i in range(X1.size):
+                out[i] = A2 / (out[i] * out[i])
+            return bad
+        for j in range(iters):
+            if check == 2 or (check == 1 and j == 0):
+                for i in range(X1.size):
+                    if X1[i] + out[i] <= zero:
+                        bad += 1
+            if j < iters - 1:
+                far = 0
+                for i in range(X1.size):
+                    F = out[i]
+                    S = X1[i] + F
+                    T = one + S
+                    E = (L[i] + F - X2[i]) / T
+                    dF = (T + half * E) * E * S / (T + E * (one + E * third))
+                    u = -dF / S
+                    if abs(u) >= umax:
+                        far += 1
+                    L[i] += _log1p_series(u, c)
+                    out[i] = F - dF
+                if far:
+                    for i in range(X1.size):
+                        w[i] = X1[i] + out[i]
+                    _log_reduced(w)
+                    for i in range(X1.size):
+                        L[i] = w[i]
+            else:
+                # Last step: no log update, final mapping fused in
+                for i in range(X1.size):
+                    F = out[i]
+                    S = X1[i] + F
+                    T = one + S
+                    E = (L[i] + F - X2[i]) / T
+                    F -= (T + half * E) * E * S / (T + E * (one + E * third))
+                    out[i] = A2 / (F * F)
+        return bad
+
+    @njit(parallel=True, cache=True)
+    def _clamond_kernel(R, K, out, iters, check, c):
+        """
+        Run _clamond_prep + _clamond_block over _BLOCK-sized slices in parallel
+        (prange), with X1, X2, L as block-local scratch: nothing but R, K and
+        out is ever full size. K is either R-sized or a single value.
+        The block calls go through slices rather than a flat prange loop,
+        which Numba's parfor lowering would otherwise keep scalar.
+        Returns the number of log domain errors found.
+        """
+        n = R.size
+        bad = 0
+        for b in prange((n + _BLOCK - 1) // _BLOCK):
+            lo = b * _BLOCK
+            hi = min(lo + _BLOCK, n)
+            X1 = np.empty(hi - lo, dtype=R.dtype)
+            X2 = np.empty(hi - lo, dtype=R.dtype)
+            L = np.empty(hi - lo, dtype=R.dtype)
+            w = np.empty(hi - lo, dtype=R.dtype)
+            Kb = K[lo:hi] if K.size == n else K
+            _clamond_prep(R[lo:hi], Kb, X1, X2, L, w, iters)
+            bad += _clamond_block(X1, X2, L, w, out[lo:hi], iters, check, c)
+        return bad
+
+def _clamond_scalar(R, K, iters, check):
+    """
+    Clamond iteration for one float (R, K) pair with math.log, no NumPy calls.
+    Compiled with Numba when available; same steps as the array paths.
+    """
+    if not R > 0.0:
+        return math.nan                       # validate='none'; math.log would raise
+    X1 = K * R * _C1
+    X2 = math.log(R) + _C2
+    F = X2 - 0.2
+    S = X1 + F
+    L = 0.0
+    for j in range(iters):
+        if S <= 0.0 and (check == 2 or (check == 1 and j == 0)):
+            raise FloatingPointError(_LOG_DOMAIN_MSG)
+        if j == 0:
+            if S <= 0.0:
+                return math.nan               # validate='none'
+            L = math.log(S)
+        T = 1.0 + S
+        E = (L + F - X2) / T
+        dF = (T + 0.5 * E) * E * S / (T + E * (1.0 + E * (1.0 / 3.0)))
+        F = F - dF
+        if j < iters - 1:
+            u = -dF / S
+            S = X1 + F
+            if abs(u) < _U_MAX:
+                L = L + _log1p_series(u, _ATANH2)
+            elif S > 0.0:
+                L = math.log(S)
+            else:
+                L = math.nan
+    return _A2 / (F * F)
+
+if _HAVE_NUMBA:
+    _clamond_scalar = njit(cache=True)(_clamond_scalar)
+
+@functools.lru_cache(maxsize=1024)
+def _clamond_scalar_cached(R, K, iters, check):
+    """
+    Memoised _clamond_scalar: engineering sweeps (e.g. iters=1 vs 2 on the same
+    pipe) repeat (R, K, iters) tuples; a hit skips the math entirely.
+    """
+    return _clamond_scalar(R, K, iters, check)
+
+@np.errstate(invalid="ignore", divide="ignore")
+def _clamond_numpy(R, K, iters, check, out=None):
+    """
+    Clamond iteration with NumPy ufuncs (also the fallback without Numba).
+    F is iterated in out when given (broadcast shape, R.dtype). Bad inputs
+    give NaN without NumPy warnings, as in the Numba kernel; log-domain errors
+    are reported by _check_log_domain only.
+    """
+    # Scratch buffers of the broadcast shape, allocated once: every ufunc below
+    # writes through out=/in-place so the iterations allocate nothing.
+    shape = np.broadcast_shapes(R.shape, np.shape(K))
+    X1, S, T, E, num, den = (np.empty(shape, dtype=R.dtype) for _ in range(6))
+    F = np.empty(shape, dtype=R.dtype) if out is None else out
+
+    # Vectorized initialization (X1, X2 same as paper)
+    np.multiply(K, R, out=X1)
+    X1 *= _C1                             # = K*R*ln(10)/18.574
+    # X2 must be the exact log: besides seeding F it is the constant term of
+    # the residual log(X1 + F) + F - X2 that the iterations drive to zero, so
+    # any error in X2 moves the converged F itself (a ~1% approximation of
+    # ln(R) would shift f by ~0.1-1%, and no number of iterations undoes it).
+    X2 = np.log(R)
+    X2 += _C2                             # = ln(R*ln(10)/5.02)
+
+    # Initial guess F (named 'F' in Clamond's MATLAB/Fortran). A sharper seed
+    # would not save a log: one quartic step reaches machine precision only from
+    # |dF/F| < ~3e-4, which every explicit formula buys with its own log, while
+    # the second step of the compiled paths is already log-free. So the paper's seed
+    # stays, with two steps by default.
+    np.subtract(X2, 0.2, out=F)
+
+    # Quartic iterations (usually 1–2 are enough for machine precision)
+    # with S = X1 + F and T = 1 + S formed once per step. Here log(S) stays an
+    # np.log per step: NumPy's SIMD log is one pass, cheaper than the ~13 ufunc
+    # passes of the carried log1p update used by the compiled paths.
+    #
+    # X1 + F > 0 is checked once up front (this should not happen for physical
+    # R, K with the standard initialization), or before every step for 'strict'.
+    # NaN/inf inputs propagate to NaN, as in the Numba kernel.
+    for j in range(iters):
+        np.add(X1, F, out=S)
+        if check == 2 or (check == 1 and j == 0):
+            _check_log_domain(S)
+        np.add(S, 1.0, out=T)                     # T = 1 + S
+
+        np.log(S, out=E)                          # E = (log(S) + F - X2) / T
+        E += F
+        E -= X2
+        E /= T
+
+        np.multiply(E, 0.5, out=num)              # num = (T + E/2) * E * S
+        num += T
+        num *= E
+        num *= S
+        np.multiply(E, 1.0 / 3.0, out=den)        # den = T + E * (1 + E/3)
+        den += 1.0
+        den *= E
+        den += T
+        num /= den                                # num = dF
+        F -= num
+
+    # Final mapping: f = ( (0.5*ln(10))/F )^2 = _A2 / F^2
+    np.multiply(F, F, out=F)
+    np.divide(_A2, F, out=F)
+    return F if F.ndim or out is not None else F[()]
 
-def f_clamond(R, K=0.0, iters: int = 2):
+def _clamond_numba(R, K, iters, check, out=None):
+    """
+    Clamond iteration through the fused Numba kernel (array inputs).
+    The kernel writes straight into out when given and C-contiguous.
+    """
+    # Everything, logs included (see _log_reduced), is computed per block
+    # inside the kernel. A float K (the common case) is passed as one value
+    # and never broadcast or copied to full size.
+    shape = np.broadcast_shapes(R.shape, np.shape(K))
+    if R.shape != shape:
+        R = np.broadcast_to(R, shape)
+    R = np.ascontiguousarray(R).ravel()
+    if isinstance(K, float):
+        K = np.full(1, K, dtype=R.dtype)
+    else:
+        if K.shape != shape:
+            K = np.broadcast_to(K, shape)
+        K = np.ascontiguousarray(K).ravel()
+    if out is not None and out.flags.c_contiguous:
+        f = out.reshape(-1)               # a view: results land in out
+    else:
+        f = np.empty(R.size, dtype=R.dtype)
+    c = _ATANH2_F32 if R.dtype == np.float32 else _ATANH2
+    bad = _clamond_kernel(R, K, f, iters, check, c)
+    if bad:
+        raise FloatingPointError(_LOG_DOMAIN_MSG)
+    if out is None:
+        return f.reshape(shape)
+    if not out.flags.c_contiguous:
+        np.copyto(out, f.reshape(shape))
+    return out
+
+def f_clamond(R, K=0.0, iters: int = 2, dtype=np.float64, validate="once", out=None):
     """
     Compute Darcy–Weisbach friction factor using Clamond's algorithm (quartic iterations).
 
@@ -39,53 +490,171 @@ def f_clamond(R, K=0.0, iters: int = 2):
     K : float or np.ndarray, optional
         Relative roughness epsilon/D (K >= 0). Default is 0.0.
     iters : int, optional
-        Number of quartic iterations (>= 0). Default 2 (per paper).
+        Number of quartic iterations (>= 0). Default 2 (per paper): ~1e-15
+        relative error in f for R >= 2300; iters=1 gives ~2e-4.
+    dtype : np.float64 or np.float32, optional
+        Working precision. float32 (~1e-6 relative) halves memory traffic and
+        doubles SIMD width; ample for inputs known to 2-3 significant figures.
+    validate : {'once', 'strict', 'none'} or bool, optional
+        Log-domain check on X1 + F (FloatingPointError if <= 0): 'once' before
+        the first iteration (default), 'strict' before every iteration; with
+        'once', a later non-positive X1 + F gives NaN for that element. NaN or
+        inf in R or K give NaN in f, without raising.
+        'none' (or False) trusts the caller and skips every check, including the
+        R/K range checks and the R < 2300 warning: bad inputs give NaN. True is
+        the same as 'once'.
+    out : np.ndarray, optional
+        Array of the broadcast shape and dtype to write f into (returned). A
+        C-contiguous out is filled in place with no intermediate copy.
 
     Returns
     -------
     f : float or np.ndarray
         Darcy–Weisbach friction factor (same shape as broadcasted R and K).
+        Array results are C-contiguous, so follow-on arithmetic such as
+        dp/dx = f * (rho*V*V / (2*D)) stays contiguous too.
     """
-    R = np.asarray(R, dtype=np.float64)
-    K = np.asarray(K, dtype=np.float64)
-
-    if np.any(R <= 0):
-        raise ValueError("Reynolds number R must be positive.")
-    if np.any(K < 0):
-        raise ValueError("Relative roughness K must be non-negative.")
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError("dtype must be float32 or float64.")
+    iters = operator.index(iters)                 # TypeError for 2.5, not truncation
     if iters < 0:
         raise ValueError("iters must be >= 0.")
+    if isinstance(validate, (bool, np.bool_)):
+        validate = "once" if validate else "none"
+    if validate not in _VALIDATE_MODES:
+        raise ValueError("validate must be 'once', 'strict', 'none' or a bool.")
+    check = _VALIDATE_MODES[validate]
 
-    # Practical validity note (Colebrook is turbulent): warn but proceed
-    if np.any(R < 2300):
-        warnings.warn("Colebrook equation is for turbulent flow (R >= 2300).", RuntimeWarning)
+    # Fast path: one pipe at a time (the common case), no NumPy overhead
+    if (out is None and isinstance(R, (int, float)) and isinstance(K, (int, float))
+            and dtype == np.float64):
+        if check:
+            if R <= 0:
+                raise ValueError("Reynolds number R must be positive.")
+            if K < 0:
+                raise ValueError("Relative roughness K must be non-negative.")
+            if R < 2300:
+                warnings.warn("Colebrook equation is for turbulent flow (R >= 2300).", RuntimeWarning)
+        return _clamond_scalar_cached(float(R), float(K), iters, check)
 
-    # Vectorized initialization (X1, X2 same as paper)
-    X1 = K * R * _C1                      # = K*R*ln(10)/18.574
-    X2 = np.log(R) + _C2                  # = ln(R*ln(10)/5.02)
+    # A float K (the typical usage) stays a Python float: scalar-times-array
+    # arithmetic needs no K array, dtype coercion or broadcast negotiation
+    R = np.asarray(R, dtype=dtype)
+    if isinstance(K, (int, float)):
+        K = float(K)
+    else:
+        K = np.asarray(K, dtype=dtype)
 
-    # Initial guess F (named 'F' in Clamond's MATLAB/Fortran)
-    F = X2 - 0.2
+    # Range checks as min() reductions: one pass over R serves both the R > 0
+    # check and the turbulence warning, and no boolean temporaries are built
+    if check:
+        R_min = np.fmin.reduce(R, axis=None) if R.size else np.inf   # NaN-skipping min
+        if R_min <= 0:
+            raise ValueError("Reynolds number R must be positive.")
+        K_min = K if isinstance(K, float) else (np.fmin.reduce(K, axis=None) if K.size else 0.0)
+        if K_min < 0:
+            raise ValueError("Relative roughness K must be non-negative.")
 
-    # Ensure domain for log(X1 + F) remains valid during iterations
-    # If not, raise a clear error (this should not happen for physical R,K with the standard initialization).
-    def _check_log_domain(F_current):
-        if np.any((X1 + F_current) <= 0.0):
-            raise FloatingPointError(
-                "Log domain error: X1 + F <= 0 in iteration. "
-                "Check R, K values (R>3 is recommended in the paper) or reduce iters."
-            )
+        # Practical validity note (Colebrook is turbulent): warn but proceed
+        if R_min < 2300:
+            warnings.warn("Colebrook equation is for turbulent flow (R >= 2300).", RuntimeWarning)
 
-    # Quartic iterations (usually 1–2 are enough for machine precision)
-    for _ in range(iters):
-        _check_log_domain(F)
-        E = (np.log(X1 + F) + F - X2) / (1.0 + X1 + F)
-        F = F - (1.0 + X1 + F + 0.5 * E) * E * (X1 + F) / (1.0 + X1 + F + E * (1.0 + E / 3.0))
+    if out is not None:
+        shape = np.broadcast_shapes(R.shape, np.shape(K))
+        if not isinstance(out, np.ndarray) or out.shape != shape or out.dtype != dtype:
+            raise ValueError(f"out must be an ndarray of shape {shape} and dtype {dtype}.")
 
-    # Final mapping: f = ( (0.5*ln(10))/F )^2
-    f = (_A / F) ** 2
+    if _CLAMOND_BACKEND == "numba" and (R.ndim > 0 or np.ndim(K) > 0):
+        f = _clamond_numba(R, K, iters, check, out)
+    else:
+        f = _clamond_numpy(R, K, iters, check, out)
 
     # Return scalar if input was scalar
     if f.shape == () and np.isscalar(R) and np.isscalar(K):
         return float(f)
     return f
+
+
+def f_clamond_f32(R, K=0.0, iters: int = 2, validate="once", out=None):
+    """
+    Single-precision f_clamond: same as f_clamond(R, K, iters, dtype=np.float32).
+    """
+    return f_clamond(R, K, iters=iters, dtype=np.float32, validate=validate, out=out)
+
+
+def f_clamond_batch(R, K=0.0, iters: int = 2, dtype=np.float64, validate="once", out=None):
+    """
+    Array-in, array-out f_clamond for structure-of-arrays pipelines.
+
+    Same as f_clamond, but always returns a C-contiguous np.ndarray (at least
+    1-D, never a Python float), or out itself when given. Reusing one out
+    buffer across the steps of a sweep avoids a fresh N-element allocation
+    per call; see f_clamond for the parameters.
+    """
+    f = f_clamond(np.asarray(R, dtype=dtype), K, iters=iters, dtype=dtype,
+                  validate=validate, out=out)
+    return f if out is not None else np.ascontiguousarray(f)
+
+
+@functools.lru_cache(maxsize=None)
+def _jax_kernel():
+    """
+    Build (once) the jitted JAX/XLA version of the iteration; jax is imported
+    here so the rest of the module never requires it.
+    """
+    import jax
+    import jax.numpy as jnp
+    from jax import lax
+
+    def kernel(R, K, iters):
+        X1 = K * R * _C1
+        X2 = jnp.log(R) + _C2
+        F0 = X2 - 0.2
+
+        def step(_, F):
+            S = X1 + F
+            T = 1.0 + S
+            E = (jnp.log(S) + F - X2) / T
+            return F - (T + 0.5 * E) * E * S / (T + E * (1.0 + E * (1.0 / 3.0)))
+
+        F = lax.fori_loop(0, iters, step, F0)
+        return _A2 / (F * F)
+
+    # iters is static (one compilation per value); fori_loop with static bounds
+    # lowers to a scan, whose element-wise body XLA fuses into one loop kernel
+    return jax.jit(kernel, static_argnums=2)
+
+
+def f_clamond_jax(R, K=0.0, iters: int = 2):
+    """
+    Clamond friction factor on JAX (CPU/GPU/TPU), for very large R/K arrays.
+
+    Same algorithm as f_clamond, compiled by XLA into a single fused kernel on
+    the default JAX device. Inputs are not range-checked (that would force a
+    device sync); invalid R or K give NaN. JAX computes in float32 unless
+    jax_enable_x64 is set.
+
+    Parameters
+    ----------
+    R : float or array_like
+        Reynolds number (R > 0; turbulent validity typically R >= 2300).
+    K : float or array_like, optional
+        Relative roughness epsilon/D (K >= 0). Default is 0.0.
+    iters : int, optional
+        Number of quartic iterations (>= 0). Default 2 (per paper).
+
+    Returns
+    -------
+    f : jax.Array
+        Darcy–Weisbach friction factor (same shape as broadcasted R and K).
+    """
+    iters = operator.index(iters)
+    if iters < 0:
+        raise ValueError("iters must be >= 0.")
+    try:
+        kernel = _jax_kernel()
+    except ImportError:
+        raise ImportError("f_clamond_jax requires jax (pip install jax).") from None
+    import jax.numpy as jnp
+    return kernel(jnp.asarray(R), jnp.asarray(K), iters)
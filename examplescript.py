@@ -126,23 +126,26 @@ def run_scenarios(iters: int = 2):
     print(header)
     print("-" * len(header))
 
-    for sc in build_scenarios():
-        D = sc["D"]
-        eps = sc["epsilon"]
-        V = sc["V"]
-        rho = sc["rho"]
-        mu = sc["mu"]
-
-        R = reynolds_number(rho=rho, V=V, D=D, mu=mu)
-        K = eps / D
-        f = f_clamond(R, K, iters=iters)
-        dpdx = pressure_gradient(f=f, rho=rho, V=V, D=D)
+    # Collect all scenarios into arrays and solve them with a single
+    # vectorized f_clamond call (one setup/dispatch instead of one per case)
+    scenarios = build_scenarios()
+    D = np.array([sc["D"] for sc in scenarios])
+    eps = np.array([sc["epsilon"] for sc in scenarios])
+    V = np.array([sc["V"] for sc in scenarios])
+    rho = np.array([sc["rho"] for sc in scenarios])
+    mu = np.array([sc["mu"] for sc in scenarios])
 
+    R = reynolds_number(rho=rho, V=V, D=D, mu=mu)
+    K = eps / D
+    f = f_clamond(R, K, iters=iters)
+    dpdx = pressure_gradient(f=f, rho=rho, V=V, D=D)
+
+    for i, sc in enumerate(scenarios):
         print(
             f"{sc['name']:38s}  "
-            f"{D:6.3f}  {eps*1e3:8.3f}  {K:9.5f}  "
-            f"{V:7.3f}  {rho:11.1f}  {mu*1e3:10.3f}  {R:12.0f}  "
-            f"{f:10.5f}  {dpdx:14.1f}"
+            f"{D[i]:6.3f}  {eps[i]*1e3:8.3f}  {K[i]:9.5f}  "
+            f"{V[i]:7.3f}  {rho[i]:11.1f}  {mu[i]*1e3:10.3f}  {R[i]:12.0f}  "
+            f"{f[i]:10.5f}  {dpdx[i]:14.1f}"
         )
 
 
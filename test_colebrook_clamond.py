@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""
+Parity checks: every f_clamond code path (NumPy, Numba kernel, compiled and
+pure-Python scalar, JAX) against a plain reference iteration with the exact
+log in every step, plus the error and validate cases.
+
+Run with:  python -m unittest -v   (or pytest)
+"""
+
+import unittest
+import warnings
+
+import numpy as np
+
+import colebrook_clamond as cc
+
+
+def _ignore_runtime_warnings(case):
+    """
+    Ignore RuntimeWarning (R < 2300 note) for one test, restoring the filters
+    afterwards; TestCase.enterContext(warnings.catch_warnings()) on 3.11+.
+    """
+    ctx = warnings.catch_warnings()
+    ctx.__enter__()
+    case.addCleanup(ctx.__exit__, None, None, None)
+    warnings.simplefilter("ignore", RuntimeWarning)
+
+
+def _reference(R, K, iters):
+    """
+    Clamond's iteration as originally written: exact log in every step, float64.
+    """
+    R = np.asarray(R, dtype=np.float64)
+    K = np.asarray(K, dtype=np.float64)
+    X1 = K * R * cc._C1
+    X2 = np.log(R) + cc._C2
+    F = X2 - 0.2
+    for _ in range(iters):
+        E = (np.log(X1 + F) + F - X2) / (1.0 + X1 + F)
+        F = F - (1.0 + X1 + F + 0.5 * E) * E * (X1 + F) / (1.0 + X1 + F + E * (1.0 + E / 3.0))
+    return (cc._A / F) ** 2
+
+
+def _scalar_loop(fn, R, K, iters, check):
+    """
+    Apply a scalar (R, K) implementation element by element.
+    """
+    R, K = np.broadcast_arrays(np.asarray(R, dtype=np.float64), np.asarray(K, dtype=np.float64))
+    return np.array([fn(float(r), float(k), iters, check) for r, k in zip(R.ravel(), K.ravel())]).reshape(R.shape)
+
+
+def _paths():
+    """
+    (name, f(R, K, iters, check)) for every float64 implementation present.
+    """
+    paths = [
+        ("numpy", cc._clamond_numpy),
+        ("scalar", lambda R, K, it, chk: _scalar_loop(cc._clamond_scalar, R, K, it, chk)),
+    ]
+    if cc._HAVE_NUMBA:
+        paths += [
+            ("numba", cc._clamond_numba),
+            ("scalar-python", lambda R, K, it, chk: _scalar_loop(cc._clamond_scalar.py_func, R, K, it, chk)),
+        ]
+    return paths
+
+
+class TestParity(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(2008)
+        n = 3000                              # several Numba blocks, one partial
+        K = np.where(rng.random(n) < 0.2, 0.0, 10.0 ** rng.uniform(-7, -1, n))
+        self.turbulent = (10.0 ** rng.uniform(np.log10(2300), 9, n), K)
+        self.low = (rng.uniform(3.05, 2300, n), K)   # paper's domain is R > 3
+        _ignore_runtime_warnings(self)
+
+    def assert_close(self, got, want, rtol, msg):
+        np.testing.assert_allclose(got, want, rtol=rtol, atol=0.0, err_msg=msg)
+
+    def test_paths_match_reference(self):
+        for R, K in (self.turbulent, self.low):
+            for iters in range(0, 6):
+                want = _reference(R, K, iters)
+                for name, fn in _paths():
+                    self.assert_close(fn(R, K, iters, 1), want, 1e-13, f"{name}, iters={iters}")
+
+    def test_low_reynolds_keeps_converging(self):
+        R = np.array([3.04, 3.1, 3.5, 10.0])     # large first steps: exact log taken
+        for iters in (3, 4, 8):
+            want = _reference(R, 0.0, iters)
+            for name, fn in _paths():
+                self.assert_close(fn(R, 0.0, iters, 1), want, 1e-14, f"{name}, iters={iters}")
+
+    def test_public_entry_points(self):
+        R, K = self.turbulent
+        want = _reference(R, K, 2)
+        self.assert_close(cc.f_clamond(R, K), want, 1e-14, "f_clamond")
+        self.assert_close(cc.f_clamond_batch(R, K), want, 1e-14, "f_clamond_batch")
+        out = np.empty_like(R)
+        self.assertIs(cc.f_clamond(R, K, out=out), out)
+        self.assert_close(out, want, 1e-14, "out=")
+        f = cc.f_clamond(7e5, 0.01)
+        self.assertIsInstance(f, float)
+        self.assertAlmostEqual(f, float(_reference(7e5, 0.01, 2)), delta=1e-15)
+        self.assert_close(cc.f_clamond_f32(R, K), want, 2e-5, "f_clamond_f32")
+        self.assert_close(cc.f_clamond(R.reshape(30, 100), 1e-4),
+                          _reference(R, 1e-4, 2).reshape(30, 100), 1e-14, "2-D")
+
+    def test_numpy_and_numba_agree_in_float32(self):
+        if not cc._HAVE_NUMBA:
+            self.skipTest("numba not installed")
+        R, K = (np.asarray(a, dtype=np.float32) for a in self.turbulent)
+        self.assert_close(cc._clamond_numba(R, K, 2, 1), cc._clamond_numpy(R, K, 2, 1), 2e-6, "float32")
+
+    def test_log_reduced_special_values(self):
+        if not cc._HAVE_NUMBA:
+            self.skipTest("numba not installed")
+        x = np.array([np.inf, 5e-324, 1e-310, 2.2250738585072014e-308, 1e-300, 0.5, 1.0, 3.0,
+                      1.7976931348623157e308, 0.0, -1.0, -np.inf, np.nan])
+        got = x.copy()
+        cc._log_reduced(got)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            want = np.log(np.where(x > 0.0, x, np.nan))
+        np.testing.assert_allclose(got, want, rtol=1e-15, atol=0.0)
+
+        x = np.array([np.inf, 1e-45, 1e-40, 1.17549435e-38, 1e-30, 0.5, 1.0, 3.0,
+                      3.4e38, 0.0, -1.0, -np.inf, np.nan], dtype=np.float32)
+        got = x.copy()
+        cc._log_reduced(got)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            want = np.log(np.where(x > 0.0, x, np.nan))
+        self.assertEqual(got.dtype, np.float32)
+        np.testing.assert_allclose(got, want, rtol=2e-7, atol=0.0)
+
+    def test_jax(self):
+        try:
+            import jax  # noqa: F401
+        except ImportError:
+            self.skipTest("jax not installed")
+        R, K = self.turbulent
+        got = np.asarray(cc.f_clamond_jax(R, K))
+        self.assert_close(got, _reference(R, K, 2), 1e-4 if got.dtype == np.float32 else 1e-13, "jax")
+
+
+class TestErrors(unittest.TestCase):
+
+    def setUp(self):
+        _ignore_runtime_warnings(self)
+
+    def test_iters_must_be_a_nonnegative_integer(self):
+        for R in (7e5, np.array([7e5])):
+            for iters in (2.5, 1.5, "2"):
+                with self.assertRaises(TypeError):
+                    cc.f_clamond(R, 0.01, iters=iters)
+            with self.assertRaises(ValueError):
+                cc.f_clamond(R, 0.01, iters=-1)
+        with self.assertRaises(TypeError):
+            cc.f_clamond_jax(7e5, 0.01, iters=2.5)
+        self.assertEqual(cc.f_clamond(7e5, 0.01, iters=np.int64(2)), cc.f_clamond(7e5, 0.01))
+
+    def test_range_checks(self):
+        for R, K in ((0.0, 0.0), (-1.0, 0.0), (np.array([1e5, 0.0]), 0.0),
+                     (np.array([np.nan, -1.0]), 0.0), (1e5, -1.0), (np.array([1e5]), np.array([np.nan, -1.0]))):
+            with self.assertRaises(ValueError):
+                cc.f_clamond(R, K)
+
+    def test_log_domain_error_on_every_path(self):
+        R = np.array([1.0, 1e5])                  # X1 + F0 < 0 for R = 1, K = 0
+        for name, fn in _paths():
+            for check in (1, 2):
+                with self.assertRaises(FloatingPointError, msg=name):
+                    fn(R, 0.0, 2, check)
+        with self.assertRaises(FloatingPointError):
+            cc.f_clamond(1.0)
+
+    def test_validate_none_gives_nan(self):
+        R = np.array([-1.0, 0.0, 1.0, 1e5])
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")             # NaN, not a NumPy warning
+            for name, fn in _paths():
+                f = fn(R, 0.0, 2, 0)
+                self.assertTrue(np.isnan(f[:3]).all(), name)
+                self.assert_close_scalar(f[3], name)
+            self.assertTrue(np.isnan(cc.f_clamond(-1.0, validate="none")))
+            self.assertTrue(np.isnan(cc.f_clamond(np.array(-1.0), validate="none")))
+            self.assertTrue(np.isnan(cc.f_clamond(R, validate=False)[:3]).all())
+            self.assertTrue(np.isnan(cc.f_clamond(R, validate=np.False_)[:3]).all())
+        with self.assertRaises(ValueError):
+            cc.f_clamond(R, validate=np.True_)          # 'once': R <= 0 rejected
+        with self.assertRaises(ValueError):
+            cc.f_clamond(R, validate="never")
+
+    def test_nan_and_inf_inputs_give_nan(self):
+        R = np.array([np.nan, np.inf, 1e5, 1e5, 1e5])
+        K = np.array([0.01, 0.01, np.nan, np.inf, 0.01])
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            for name, fn in _paths():
+                for check in (0, 1, 2):
+                    f = fn(R, K, 2, check)
+                    self.assertTrue(np.isnan(f[:4]).all(), f"{name}, check={check}")
+                    self.assert_close_scalar(f[4], name, K=0.01)
+            self.assertTrue(np.isnan(cc.f_clamond(float("nan"), 0.01)))
+
+    def test_out_must_match(self):
+        R = np.full((3, 4), 1e5)
+        for out in (np.empty(12), np.empty((3, 4), np.float32), [0.0] * 12):
+            with self.assertRaises(ValueError):
+                cc.f_clamond(R, 0.01, out=out)
+
+    def assert_close_scalar(self, f, name, K=0.0):
+        np.testing.assert_allclose(f, _reference(1e5, K, 2), rtol=1e-14, err_msg=name)
+
+
+class TestScalarCache(unittest.TestCase):
+
+    def setUp(self):
+        cc._clamond_scalar_cached.cache_clear()
+
+    def test_repeated_call_hits_the_cache(self):
+        f = cc.f_clamond(7e5, 0.01)
+        hits = cc._clamond_scalar_cached.cache_info().hits
+        self.assertEqual(cc.f_clamond(7e5, 0.01), f)
+        self.assertEqual(cc._clamond_scalar_cached.cache_info().hits, hits + 1)
+        self.assertNotEqual(cc.f_clamond(7e5, 0.01, iters=1), f)   # iters is part of the key
+
+    def test_checks_still_run_on_cached_calls(self):
+        for _ in range(2):
+            with self.assertWarns(RuntimeWarning):
+                cc.f_clamond(1000.0, 0.01)
+            with self.assertRaises(ValueError):
+                cc.f_clamond(-1.0, 0.01)
+            with self.assertRaises(ValueError):
+                cc.f_clamond(1e5, -1.0)
+        self.assertEqual(cc._clamond_scalar_cached.cache_info().hits, 1)
+
+    def test_log_domain_error_is_not_cached(self):
+        _ignore_runtime_warnings(self)
+        for _ in range(2):
+            with self.assertRaises(FloatingPointError):
+                cc.f_clamond(1.0)
+        info = cc._clamond_scalar_cached.cache_info()
+        self.assertEqual((info.hits, info.currsize), (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()